@@ -56,13 +56,33 @@ __repo__ = "https://github.com/fourstix/Sparkfun_CircuitPython_QwiicTwist.git"
 
 # imports
 
+from struct import pack_into, unpack_from
 from time import sleep
 from micropython import const
 from adafruit_bus_device.i2c_device import I2CDevice
 
+try:
+    # Only needed for the async methods
+    import asyncio
+except ImportError:
+    pass
+
+try:
+    # millisecond clock that stays a small int on CircuitPython
+    from supervisor import ticks_ms
+except ImportError:
+    from time import monotonic
+
+    def ticks_ms() -> int:
+        # ports without supervisor (CPython), wrapped the same way
+        return int(monotonic() * 1000) & _TICKS_MAX
+
+
 try:
     # Only used for typing
+    from typing import Optional
     from busio import I2C
+    from digitalio import DigitalInOut
 except ImportError:
     pass
 
@@ -79,6 +99,20 @@ _BUTTON_PRESSED_BIT = const(1)
 _ENCODER_MOVED_BIT = const(0)
 _BUTTON_INT_ENABLE = const(1)
 _ENCODER_INT_ENABLE = const(0)
+_STATUS_EVENTS = const(0x07)  # clicked, pressed and moved bits
+
+# a status read or snapshot serves back-to-back property checks for this long
+_CACHE_TTL_MS = const(5)
+
+# supervisor.ticks_ms() wraps at 2**29
+_TICKS_MAX = const(0x1FFFFFFF)
+
+# waits between checks for the twist at its new address, about 1 second in all
+_CHANGE_ADDRESS_DELAYS = (0.02, 0.05, 0.1, 0.2, 0.4, 0.25)
+
+# status, version, enable ints, count, difference, last encoder and button events
+_SNAPSHOT_FORMAT = "<BHBhhHH"
+_SNAPSHOT_SIZE = const(12)
 
 # register constants
 _TWIST_ID = const(0x00)
@@ -98,82 +132,249 @@ _TWIST_CONNECT_BLUE = const(0x14)
 _TWIST_TURN_INT_TIMEOUT = const(0x16)
 _TWIST_CHANGE_ADDRESS = const(0x18)
 
-# private functions
-def _signed_int16(value: int) -> int:
-    # convert a 16-bit value into a signed integer
-    result = value
 
-    if result & (1 << 15):
-        result -= 1 << 16
+# single worker thread for the async methods, created on first use
+_executor = None
 
-    return result
+# private functions
+def _cache_expired(since: int) -> bool:
+    # True once more than _CACHE_TTL_MS has passed since the ticks_ms() value
+    return (ticks_ms() - since) & _TICKS_MAX > _CACHE_TTL_MS
+
+
+async def _run_blocking(func, *args):
+    # Run a blocking bus call on a worker thread where the event loop
+    # supports executors (CPython), otherwise call it directly (CircuitPython).
+    # A single worker keeps the cached status and difference state from
+    # being updated by two threads at once.
+    global _executor  # pylint: disable=global-statement
+    loop = asyncio.get_event_loop()
+    if hasattr(loop, "run_in_executor"):
+        if _executor is None:
+            # pylint: disable=import-outside-toplevel
+            from concurrent.futures import ThreadPoolExecutor
+
+            _executor = ThreadPoolExecutor(max_workers=1)
+        return await loop.run_in_executor(_executor, func, *args)
+    return func(*args)
+
+
+class _DebugDevice:
+    # I2CDevice wrapper that prints each register transfer
+    def __init__(self, device: I2CDevice):
+        self._device = device
+        self.device_address = device.device_address
+        self._addr = 0
+
+    def __enter__(self):
+        self._device.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._device.__exit__(exc_type, exc_value, traceback)
+
+    def write(self, buf, *, start=0, end=None):
+        self._device.write(buf, start=start, end=end)
+        if end is None:
+            end = len(buf)
+        self._addr = buf[start]
+        if end - start > 1:
+            print("$%02X <= %s" % (buf[start], [hex(i) for i in buf[start + 1 : end]]))
+
+    def readinto(self, buf, **kwargs):
+        self._device.readinto(buf, **kwargs)
+        print("$%02X => %s" % (self._addr, [hex(i) for i in buf]))
+
+    def write_then_readinto(self, out_buffer, in_buffer, **kwargs):
+        self._device.write_then_readinto(out_buffer, in_buffer, **kwargs)
+        self._addr = out_buffer[0]
+        print("$%02X => %s" % (self._addr, [hex(i) for i in in_buffer]))
+
+
+class _LEDBatch:  # pylint: disable=protected-access
+    # Context manager returned by Sparkfun_QwiicTwist.batch_leds()
+    def __init__(self, twist):
+        self._twist = twist
+        self._outer = False
+
+    def __enter__(self):
+        # only the outermost batch collects and flushes the writes
+        if self._twist._pending is None:
+            self._twist._pending = {}
+            self._outer = True
+        return self._twist
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._outer:
+            pending = self._twist._pending
+            self._twist._pending = None
+            self._outer = False
+            if exc_type is None:
+                self._twist._flush_pending(pending)
+
+
+class _TwistTransaction:  # pylint: disable=protected-access
+    # Register access on a Twist while its bus lock is held, returned by
+    # Sparkfun_QwiicTwist.transaction()
+    def __init__(self, twist):
+        self._twist = twist
+        self._device = None
+
+    def __enter__(self):
+        self._device = self._twist._device.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._device = None
+        return self._twist._device.__exit__(exc_type, exc_value, traceback)
+
+    def bind(self, device) -> None:
+        """
+        Use the device directly, for callers that already hold the bus lock.
+        Pass None to unbind it again.
+        """
+        self._device = device
+
+    def readinto(self, addr: int, buf: bytearray) -> None:
+        """Read consecutive registers, starting at the specified address, into buf."""
+        self._twist._read_into(self._device, addr, buf)
+
+    def read8(self, addr: int) -> int:
+        """Read and return a byte from the specified 8-bit register address."""
+        result = self._twist._rbuf1
+        self._twist._read_into(self._device, addr, result)
+        return result[0]
+
+    def read16(self, addr: int) -> int:
+        """Read and return a 16-bit value from the specified 8-bit register."""
+        result = self._twist._rbuf2
+        self._twist._read_into(self._device, addr, result)
+        return unpack_from("<H", result)[0]
+
+    def read16_signed(self, addr: int) -> int:
+        """Read and return a signed 16-bit value from the specified 8-bit register."""
+        result = self._twist._rbuf2
+        self._twist._read_into(self._device, addr, result)
+        return unpack_from("<h", result)[0]
+
+    def write8(self, addr: int, value: int) -> None:
+        """Write a byte to the specified 8-bit register address."""
+        buf = self._twist._wbuf2
+        buf[0] = addr & 0xFF
+        buf[1] = value & 0xFF
+        self._device.write(buf)
+
+    def write16(self, addr: int, value: int) -> None:
+        """Write a 16-bit value to the specified 8-bit register address."""
+        # write LSB then MSB
+        buf = self._twist._wbuf3
+        buf[0] = addr & 0xFF
+        pack_into("<H", buf, 1, value & 0xFFFF)
+        self._device.write(buf)
 
 
 # class
 class Sparkfun_QwiicTwist:
     """CircuitPython class for the Sparkfun QwiicTwist RGB Rotary Encoder"""
 
-    def __init__(self, i2c: I2C, address: int = QWIIC_TWIST_ADDR, debug: bool = False):
-        """Initialize Qwiic Twist for i2c communication."""
-        self._device = I2CDevice(i2c, address)
+    def __init__(
+        self,
+        i2c: I2C,
+        address: int = QWIIC_TWIST_ADDR,
+        debug: bool = False,
+        int_pin: Optional[DigitalInOut] = None,
+    ):
+        """
+        Initialize Qwiic Twist for i2c communication.
+
+        If int_pin is given, it is set up as an input with a pull-up and the
+        Twist interrupts are enabled. While the pin is high (no interrupt),
+        moved, pressed, clicked and difference return without an i2c read,
+        so events are reported once the Twist raises its interrupt.
+        """
         # save handle to i2c bus in case address is changed
         self._i2c = i2c
         self._debug = debug
+        self._device = self._make_device(address)
+        # status bits read from (and cleared on) the Twist, not yet reported
+        self._status_cache = 0
+        self._status_time = None
+        # LED register writes deferred by batch_leds(), keyed by address
+        self._pending = None
+        # last snapshot() reading
+        self._snap_buf = bytearray(_SNAPSHOT_SIZE)
+        self._snapshot = None
+        self._snapshot_time = None
+        # register address for reads, and whether write_then_readinto() works
+        self._addr_buf = bytearray(1)
+        self._use_combined = None
+        # scratch buffers for register writes (address + data) and reads
+        self._wbuf2 = bytearray(2)
+        self._wbuf3 = bytearray(3)
+        self._wbuf4 = bytearray(4)
+        self._wbuf7 = bytearray(7)
+        # largest batch_leds() run: address + _TWIST_RED through _TWIST_CONNECT_BLUE
+        self._wbuf10 = bytearray(10)
+        self._rbuf1 = bytearray(1)
+        self._rbuf2 = bytearray(2)
+        # reusable handle for transaction() and the register helpers
+        self._transaction = _TwistTransaction(self)
+        # id and firmware version, which do not change once read
+        self._id_cached = None
+        self._version_str = None
+        # interrupt pin, and whether a move was seen since difference was read
+        self._int_pin = int_pin
+        self._diff_pending = False
+        if int_pin is not None:
+            from digitalio import Pull  # pylint: disable=import-outside-toplevel
+
+            # INT is open-drain and active low
+            int_pin.switch_to_input(pull=Pull.UP)
+            self._write_register8(
+                _TWIST_ENABLE_INTS,
+                (1 << _BUTTON_INT_ENABLE) | (1 << _ENCODER_INT_ENABLE),
+            )
 
     # public properites (read-only)
 
     @property
     def connected(self) -> bool:
-        """Check the id of Rotary Encoder.  Returns True if successful."""
-        if self._read_register8(_TWIST_ID) != QWIIC_TWIST_ID:
-            return False
-        return True
+        """
+        Check the id of Rotary Encoder.  Returns True if successful.
+        Once the id has matched it is not read again, use recheck()
+        to probe the device again.
+        """
+        if self._id_cached == QWIIC_TWIST_ID:
+            return True
+        return self.recheck()
 
     @property
     def version(self) -> str:
         """Return the version string for the Twist firmware."""
-        value = self._read_register16(_TWIST_VERSION)
-        # LSB is Major and MSB is minor
-        major = value & 0xFF
-        minor = (value >> 8) & 0xFF
+        if self._version_str is None:
+            value = self._read_register16(_TWIST_VERSION)
+            # LSB is Major and MSB is minor
+            major = value & 0xFF
+            minor = (value >> 8) & 0xFF
 
-        return "v" + str(major) + "." + str(minor)
+            self._version_str = "v" + str(major) + "." + str(minor)
+
+        return self._version_str
 
     @property
     def moved(self) -> bool:
         """Return true if the knob has been twisted."""
-        status = self._read_register8(_TWIST_STATUS)
-
-        moved = status & (1 << _ENCODER_MOVED_BIT)
-
-        # We've read this status bit, now clear it
-        self._write_register8(_TWIST_STATUS, status & ~(1 << _ENCODER_MOVED_BIT))
-
-        return bool(moved)
+        return self._status_bit(_ENCODER_MOVED_BIT)
 
     @property
     def pressed(self) -> bool:
         """"Return true if button is currently pressed."""
-        status = self._read_register8(_TWIST_STATUS)
-
-        pressed = status & (1 << _BUTTON_PRESSED_BIT)
-
-        # We've read this status bit, now clear it
-        self._write_register8(_TWIST_STATUS, status & ~(1 << _BUTTON_PRESSED_BIT))
-
-        return bool(pressed)
+        return self._status_bit(_BUTTON_PRESSED_BIT)
 
     @property
     def clicked(self) -> bool:
         """Return true if a click event has occurred. Event flag is then reset."""
-        status = self._read_register8(_TWIST_STATUS)
-
-        clicked = status & (1 << _BUTTON_CLICKED_BIT)
-
-        # We've read this status bit, now clear it
-        self._write_register8(_TWIST_STATUS, status & ~(1 << _BUTTON_CLICKED_BIT))
-
-        return bool(clicked)
+        return self._status_bit(_BUTTON_CLICKED_BIT)
 
     @property
     def difference(self) -> int:
@@ -181,8 +382,13 @@ class Sparkfun_QwiicTwist:
         Return the difference in number of clicks since previous check.
         The value is cleared after it is read.
         """
-        value = self._read_register16(_TWIST_DIFFERENCE)
-        diff = _signed_int16(value)
+        # reading the status may have released the interrupt before the
+        # difference was read, so only skip the bus if no move was seen
+        if self._interrupt_idle() and not self._diff_pending:
+            return 0
+
+        self._diff_pending = False
+        diff = self._read_register16_signed(_TWIST_DIFFERENCE)
 
         self._write_register16(_TWIST_DIFFERENCE, 0)
 
@@ -191,6 +397,9 @@ class Sparkfun_QwiicTwist:
     @property
     def time_since_last_movement(self) -> int:
         """Return the number of milliseconds since the last encoder movement"""
+        if self._snapshot_fresh():
+            return self._snapshot["last_movement"]
+
         # unsigned 16-bit value
         elapsed_time = self._read_register16(_TWIST_LAST_ENCODER_EVENT)
 
@@ -204,6 +413,9 @@ class Sparkfun_QwiicTwist:
     @property
     def time_since_last_press(self) -> int:
         """Return the number of milliseconds since the last button press and release"""
+        if self._snapshot_fresh():
+            return self._snapshot["last_press"]
+
         # unsigned 16-bit value
         elapsed_time = self._read_register16(_TWIST_LAST_BUTTON_EVENT)
 
@@ -219,12 +431,15 @@ class Sparkfun_QwiicTwist:
     @property
     def count(self) -> int:
         """Returns the number of indents since the user turned the knob."""
-        value = self._read_register16(_TWIST_COUNT)
-        return _signed_int16(value)
+        if self._snapshot_fresh():
+            return self._snapshot["count"]
+
+        return self._read_register16_signed(_TWIST_COUNT)
 
     @count.setter
     def count(self, value: int):
         """Set the number of indents to a given amount."""
+        self._snapshot_time = None
         self._write_register16(_TWIST_COUNT, value)
 
     @property
@@ -235,7 +450,7 @@ class Sparkfun_QwiicTwist:
     @red.setter
     def red(self, value: int):
         """Set the value of the red LED 0-255."""
-        self._write_register8(_TWIST_RED, value)
+        self._write_led8(_TWIST_RED, value)
 
     @property
     def green(self) -> int:
@@ -245,7 +460,7 @@ class Sparkfun_QwiicTwist:
     @green.setter
     def green(self, value: int):
         """Set the value of the green LED 0-255."""
-        self._write_register8(_TWIST_GREEN, value)
+        self._write_led8(_TWIST_GREEN, value)
 
     @property
     def blue(self) -> int:
@@ -255,47 +470,43 @@ class Sparkfun_QwiicTwist:
     @blue.setter
     def blue(self, value: int):
         """Set the value of the blue LED 0-255."""
-        self._write_register8(_TWIST_BLUE, value)
+        self._write_led8(_TWIST_BLUE, value)
 
     @property
     def red_connection(self) -> int:
         """Get the value of the red LED connection"""
-        value = self._read_register16(_TWIST_CONNECT_RED)
-        return _signed_int16(value)
+        return self._read_register16_signed(_TWIST_CONNECT_RED)
 
     @red_connection.setter
     def red_connection(self, value: int):
         """Set the value of the red LED connection."""
-        self._write_register16(_TWIST_CONNECT_RED, value)
+        self._write_led16(_TWIST_CONNECT_RED, value)
 
     @property
     def green_connection(self) -> int:
         """Get the value of the green LED connection."""
-        value = self._read_register16(_TWIST_CONNECT_GREEN)
-        return _signed_int16(value)
+        return self._read_register16_signed(_TWIST_CONNECT_GREEN)
 
     @green_connection.setter
     def green_connection(self, value: int):
         """Set the value of the green LED connection"""
-        self._write_register16(_TWIST_CONNECT_GREEN, value)
+        self._write_led16(_TWIST_CONNECT_GREEN, value)
 
     @property
     def blue_connection(self) -> int:
         """Get the value of the blue LED connection."""
-        value = self._read_register16(_TWIST_CONNECT_BLUE)
-        return _signed_int16(value)
+        return self._read_register16_signed(_TWIST_CONNECT_BLUE)
 
     @blue_connection.setter
     def blue_connection(self, value: int):
         """Set the value of the blue LED connection."""
-        self._write_register16(_TWIST_CONNECT_BLUE, value)
+        self._write_led16(_TWIST_CONNECT_BLUE, value)
 
     @property
     def int_timeout(self) -> int:
         """Get number of milliseconds that elapse between
         the end of the knob turning and interrupt firing."""
-        value = self._read_register16(_TWIST_TURN_INT_TIMEOUT)
-        return _signed_int16(value)
+        return self._read_register16_signed(_TWIST_TURN_INT_TIMEOUT)
 
     @int_timeout.setter
     def int_timeout(self, value: int):
@@ -305,22 +516,127 @@ class Sparkfun_QwiicTwist:
 
     # public methods
 
+    def recheck(self) -> bool:
+        """Read the id of Rotary Encoder again.  Returns True if successful."""
+        self._id_cached = self._read_register8(_TWIST_ID)
+        return self._id_cached == QWIIC_TWIST_ID
+
     def clear_interrupts(self) -> None:
         """Clears the moved, clicked, and pressed bits"""
+        self._status_cache = 0
         self._write_register8(_TWIST_STATUS, 0)
 
     def set_color(self, red_value: int, green_value: int, blue_value: int) -> None:
         """Set the rgb color of the encoder LEDs"""
-        self._write_register24(
-            _TWIST_RED,
-            (red_value & 0xFF) << 16 | (green_value & 0xFF) << 8 | blue_value & 0xFF,
-        )
+        if self._pending is not None:
+            # inside batch_leds(), so defer with the other LED writes
+            self._write_led8(_TWIST_RED, red_value)
+            self._write_led8(_TWIST_GREEN, green_value)
+            self._write_led8(_TWIST_BLUE, blue_value)
+            return
+
+        with self._device as device:
+            buf = self._wbuf4
+            buf[0] = _TWIST_RED
+            buf[1] = red_value & 0xFF
+            buf[2] = green_value & 0xFF
+            buf[3] = blue_value & 0xFF
+            device.write(buf)
+
+    def snapshot(self) -> dict:
+        """
+        Read the status, count, difference and event times in a single
+        i2c transfer and return them as a dictionary. The status bits and
+        the difference are cleared on the Twist, so the events in the
+        dictionary are not reported again by moved, pressed, clicked or
+        difference. For a few milliseconds afterwards count and the
+        time_since_last values are served from this reading instead of
+        the bus.
+        """
+        with self._transaction as trans:
+            return self._read_snapshot(trans)
+
+    @classmethod
+    def poll_many(cls, twists: list) -> list:
+        """
+        Take a snapshot() of each Twist in the list while holding their
+        shared i2c bus once, rather than locking it for every device.
+        All the Twists must be on the same i2c bus, otherwise ValueError is
+        raised. Returns a list of the snapshot dictionaries, in the same order.
+        """
+        # pylint: disable=protected-access
+        if not twists:
+            return []
+        i2c = twists[0]._i2c
+        for twist in twists:
+            if twist._i2c is not i2c:
+                raise ValueError("All Twists must be on the same i2c bus")
+        while not i2c.try_lock():
+            pass
+        try:
+            snapshots = []
+            for twist in twists:
+                # the bus is already locked, so use the device directly
+                trans = twist._transaction
+                trans.bind(twist._device)
+                try:
+                    snapshots.append(twist._read_snapshot(trans))
+                finally:
+                    trans.bind(None)
+            return snapshots
+        finally:
+            i2c.unlock()
 
     def connect_color(self, red_value: int, green_value: int, blue_value: int) -> None:
         """Connect all the rgb color for the encoder LEDs"""
-        self._write_register16(_TWIST_CONNECT_RED, red_value)
-        self._write_register16(_TWIST_CONNECT_GREEN, green_value)
-        self._write_register16(_TWIST_CONNECT_BLUE, blue_value)
+        if self._pending is not None:
+            # inside batch_leds(), so defer with the other LED writes
+            self._write_led16(_TWIST_CONNECT_RED, red_value)
+            self._write_led16(_TWIST_CONNECT_GREEN, green_value)
+            self._write_led16(_TWIST_CONNECT_BLUE, blue_value)
+            return
+
+        # the connection registers are contiguous, so write all three at once
+        with self._device as device:
+            buf = self._wbuf7
+            buf[0] = _TWIST_CONNECT_RED
+            pack_into(
+                "<HHH",
+                buf,
+                1,
+                red_value & 0xFFFF,
+                green_value & 0xFFFF,
+                blue_value & 0xFFFF,
+            )
+            device.write(buf)
+
+    def transaction(self) -> _TwistTransaction:
+        """
+        Return a context manager that holds the i2c bus for several register
+        accesses. It provides readinto, read8, read16, read16_signed, write8
+        and write16 methods taking a register address. Other properties and methods of
+        the Twist must not be used inside the block, since they would wait
+        for the bus held by it.
+
+        with twist.transaction() as t:
+            status = t.read8(0x01)
+            diff = t.read16_signed(0x07)
+        """
+        return self._transaction
+
+    def batch_leds(self) -> _LEDBatch:
+        """
+        Return a context manager that collects LED color and connection
+        writes, including set_color() and connect_color(), and sends them
+        when the block exits, coalescing adjacent registers into a single
+        i2c write.
+
+        with twist.batch_leds():
+            twist.red = 255
+            twist.green = 128
+            twist.blue = 0
+        """
+        return _LEDBatch(self)
 
     def change_address(self, new_address: int) -> bool:
         """Change the i2c address of Twist Rotary Encoder snd return True if successful."""
@@ -331,80 +647,215 @@ class Sparkfun_QwiicTwist:
         # write new address
         self._write_register8(_TWIST_CHANGE_ADDRESS, new_address)
 
-        # wait a second for qwiic twist to settle after change
-        sleep(1)
-
-        # try to re-create new i2c device at new address
-        try:
-            self._device = I2CDevice(self._i2c, new_address)
-        except ValueError as err:
-            print("Address Change Failure")
-            print(err)
-            return False
-
-        # if we made it here, everything went fine
-        return True
+        # poll the new address until the qwiic twist has settled after
+        # the change, rather than always waiting a full second
+        error = None
+        for delay in _CHANGE_ADDRESS_DELAYS:
+            sleep(delay)
+            # try to re-create new i2c device at new address
+            try:
+                device = self._make_device(new_address)
+                with device as dev:
+                    self._read_into(dev, _TWIST_ID, self._rbuf1)
+            except (OSError, ValueError) as err:
+                error = err
+                continue
+
+            if self._rbuf1[0] == QWIIC_TWIST_ID:
+                self._device = device
+                self._id_cached = QWIIC_TWIST_ID
+                self._version_str = None
+                # if we made it here, everything went fine
+                return True
+
+        # the twist may have left the old address, so re-read the id next time
+        self._id_cached = None
+        print("Address Change Failure")
+        if error is not None:
+            print(error)
+        return False
+
+    # async methods, for use from asyncio code
+
+    async def amoved(self) -> bool:
+        """Awaitable version of moved."""
+        return await _run_blocking(self._status_bit, _ENCODER_MOVED_BIT)
+
+    async def apressed(self) -> bool:
+        """Awaitable version of pressed."""
+        return await _run_blocking(self._status_bit, _BUTTON_PRESSED_BIT)
+
+    async def aclicked(self) -> bool:
+        """Awaitable version of clicked."""
+        return await _run_blocking(self._status_bit, _BUTTON_CLICKED_BIT)
+
+    async def adifference(self) -> int:
+        """Awaitable version of difference."""
+        return await _run_blocking(lambda: self.difference)
+
+    async def acount(self) -> int:
+        """Awaitable version of count."""
+        return await _run_blocking(lambda: self.count)
+
+    async def asnapshot(self) -> dict:
+        """Awaitable version of snapshot()."""
+        return await _run_blocking(self.snapshot)
 
     # No i2c begin function is needed since I2Cdevice class takes care of that
 
     # private methods
 
+    def _read_snapshot(self, trans: _TwistTransaction) -> dict:
+        # Take a snapshot through a transaction that holds the bus
+        buf = self._snap_buf
+        trans.readinto(_TWIST_STATUS, buf)
+        (status, _, _, count, diff, last_movement, last_press) = unpack_from(
+            _SNAPSHOT_FORMAT, buf
+        )
+        # clear what we've read so it is reported only once
+        if status & _STATUS_EVENTS:
+            trans.write8(_TWIST_STATUS, status & ~_STATUS_EVENTS)
+        if diff:
+            trans.write16(_TWIST_DIFFERENCE, 0)
+
+        self._snapshot = {
+            "status": status,
+            "count": count,
+            "difference": diff,
+            "last_movement": last_movement,
+            "last_press": last_press,
+        }
+        self._snapshot_time = ticks_ms()
+
+        return self._snapshot
+
+    def _snapshot_fresh(self) -> bool:
+        # True if snapshot() was called recently enough to serve property reads
+        return (
+            self._snapshot_time is not None
+            and not _cache_expired(self._snapshot_time)
+        )
+
+    def _make_device(self, address: int) -> I2CDevice:
+        # With debug on, every transfer is traced by a wrapper around the
+        # device, so the register helpers need no debug checks of their own.
+        device = I2CDevice(self._i2c, address)
+        if self._debug:
+            return _DebugDevice(device)
+        return device
+
+    def _interrupt_idle(self) -> bool:
+        # True if an interrupt pin is used and the Twist is not asserting it
+        return self._int_pin is not None and self._int_pin.value
+
+    def _status_bit(self, bit: int) -> bool:
+        # Return a status bit and mark it as read.  The status register is read
+        # and cleared in one go, so a single bus access serves moved, pressed
+        # and clicked when they are checked back-to-back.
+        mask = 1 << bit
+        if (
+            not self._status_cache & mask
+            and not self._interrupt_idle()
+            and (self._status_time is None or _cache_expired(self._status_time))
+        ):
+            status = self._read_modify_write8(_TWIST_STATUS, _STATUS_EVENTS)
+            if status & (1 << _ENCODER_MOVED_BIT):
+                self._diff_pending = True
+            self._status_cache |= status
+            self._status_time = ticks_ms()
+
+        result = self._status_cache & mask
+        # We've read this status bit, now clear it
+        self._status_cache &= ~mask
+
+        return bool(result)
+
+    def _read_into(self, device: I2CDevice, addr: int, result: bytearray) -> None:
+        # Read from the specified 8-bit register address into result,
+        # as one combined transaction once the port has shown it supports it.
+        self._addr_buf[0] = addr & 0xFF
+        if self._use_combined is not False:
+            try:
+                device.write_then_readinto(self._addr_buf, result)
+                self._use_combined = True
+                return
+            except OSError:
+                if self._use_combined:
+                    raise
+                # write_then_readinto() does not work on every port, so fall
+                # back to explicit write followed by read into, and only stop
+                # trying the combined transfer once the fallback has worked
+                device.write(self._addr_buf)
+                device.readinto(result)
+                self._use_combined = False
+                return
+        device.write(self._addr_buf)
+        device.readinto(result)
+
     def _read_register8(self, addr: int) -> int:
         # Read and return a byte from the specified 8-bit register address.
-        with self._device as device:
-            device.write(bytes([addr & 0xFF]))
-            result = bytearray(1)
-            # write_then_readinto() does not work reliably,
-            # so do explicit write followed by read into
-            # device.write_then_readinto(bytes([addr & 0xFF]), result)
-            device.readinto(result)
-            if self._debug:
-                print("$%02X => %s" % (addr, [hex(i) for i in result]))
-            return result[0]
+        with self._transaction as trans:
+            return trans.read8(addr)
 
     def _write_register8(self, addr: int, value: int) -> None:
         # Write a byte to the specified 8-bit register address
+        with self._transaction as trans:
+            trans.write8(addr, value)
+
+    def _write_led8(self, addr: int, value: int) -> None:
+        # Write an LED register now, or defer it when inside batch_leds()
+        if self._pending is None:
+            self._write_register8(addr, value)
+        else:
+            self._pending[addr] = value & 0xFF
+
+    def _write_led16(self, addr: int, value: int) -> None:
+        # Write an LED connection register now, or defer it when inside batch_leds()
+        if self._pending is None:
+            self._write_register16(addr, value)
+        else:
+            self._pending[addr] = value & 0xFF
+            self._pending[addr + 1] = (value >> 8) & 0xFF
+
+    def _flush_pending(self, pending: dict) -> None:
+        # Write deferred registers, one i2c write per run of adjacent addresses
+        buf = self._wbuf10
+        length = 0
+        last = None
         with self._device as device:
-            device.write(bytes([addr & 0xFF, value & 0xFF]))
-            if self._debug:
-                print("$%02X <= 0x%02X" % (addr, value))
+            for addr in sorted(pending):
+                if length and addr != last + 1:
+                    device.write(buf, end=length)
+                    length = 0
+                if not length:
+                    buf[0] = addr
+                    length = 1
+                buf[length] = pending[addr]
+                length += 1
+                last = addr
+            if length:
+                device.write(buf, end=length)
+
+    def _read_modify_write8(self, addr: int, mask: int) -> int:
+        # Read a byte from the specified 8-bit register address and clear
+        # the mask bits, holding the bus for both. Returns the byte read.
+        with self._transaction as trans:
+            value = trans.read8(addr)
+            if value & mask:
+                trans.write8(addr, value & ~mask)
+            return value
 
     def _read_register16(self, addr: int) -> int:
         # Read and return a 16-bit value from the specified 8-bit register address.
-        with self._device as device:
-            device.write(bytes([addr & 0xFF]))
-            result = bytearray(2)
-            # write_then_readinto() does not work reliably,
-            # so do explicit write followed by read into
-            # device.write_then_readinto(bytes([addr & 0xFF]), result)
-            device.readinto(result)
-            if self._debug:
-                print("$%02X => %s" % (addr, [hex(i) for i in result]))
-            return (result[1] << 8) | result[0]
+        with self._transaction as trans:
+            return trans.read16(addr)
+
+    def _read_register16_signed(self, addr: int) -> int:
+        # Read and return a signed 16-bit value from the specified 8-bit register.
+        with self._transaction as trans:
+            return trans.read16_signed(addr)
 
     def _write_register16(self, addr: int, value: int) -> None:
         # Write a 16-bit big endian value to the specified 8-bit register
-        with self._device as device:
-            # write LSB then MSB
-            device.write(bytes([addr & 0xFF, value & 0xFF, (value >> 8) & 0xFF]))
-            if self._debug:
-                print("$%02X <= 0x%02X" % (addr, value & 0xFF))
-                print("$%02X <= 0x%02X" % (addr, (value >> 8) & 0xFF))
-
-    def _write_register24(self, addr: int, value: int) -> None:
-        # Write a byte to the specified 8-bit register address
-        with self._device as device:
-            device.write(
-                bytes(
-                    [
-                        addr & 0xFF,
-                        (value >> 16) & 0xFF,
-                        (value >> 8) & 0xFF,
-                        value & 0xFF,
-                    ]
-                )
-            )
-            if self._debug:
-                print("$%02X <= 0x%02X" % (addr, (value >> 16) & 0xFF))
-                print("$%02X <= 0x%02X" % (addr, (value >> 8) & 0xFF))
-                print("$%02X <= 0x%02X" % (addr, value & 0xFF))
+        with self._transaction as trans:
+            trans.write16(addr, value)
@@ -30,11 +30,45 @@ Implementation Notes
 import time
 from adafruit_bus_device.i2c_device import I2CDevice
 
+try:
+    # Only needed for the async methods
+    import asyncio
+except ImportError:
+    pass
+
 __version__ = "0.0.3"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
 
 _I2C_INIT_DELAY = 0.1
 
+# turn off encrypted data
+# http://wiibrew.org/wiki/Wiimote/Extension_Controllers
+_INIT1 = b"\xF0\x55"
+_INIT2 = b"\xFB\x00"
+# register holding the controller data
+_REG0 = b"\x00"
+
+
+# single worker thread for the async methods, created on first use
+_executor = None
+
+
+async def _run_blocking(func, *args):
+    # Run a blocking bus call on a worker thread where the event loop
+    # supports executors (CPython), otherwise call it directly (CircuitPython).
+    # A single worker keeps the sample buffer and init state from being
+    # updated by two threads at once.
+    global _executor  # pylint: disable=global-statement
+    loop = asyncio.get_event_loop()
+    if hasattr(loop, "run_in_executor"):
+        if _executor is None:
+            # pylint: disable=import-outside-toplevel
+            from concurrent.futures import ThreadPoolExecutor
+
+            _executor = ThreadPoolExecutor(max_workers=1)
+        return await loop.run_in_executor(_executor, func, *args)
+    return func(*args)
+
 
 class WiiChuckBase:  # pylint: disable=too-few-public-methods
     """
@@ -48,26 +82,111 @@ class WiiChuckBase:  # pylint: disable=too-few-public-methods
         conservative default of 2000us is used since some hosts may
         not be able to achieve such timing.
     :type i2c_read_delay: float, optional
+    :param combined: Read with one combined (repeated start) transaction
+        instead, without the delay, for hosts and accessories that
+        tolerate it. Default is False.
+    :type combined: bool, optional
+
+    The accessory is initialized by the first read, or explicitly with
+    `begin_sync`. From asyncio code use ``await begin()`` instead, so that
+    several accessories can be initialized at the same time.
     """
 
-    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002):
+    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002, combined=False):
         self.buffer = bytearray(8)
         self.i2c_device = I2CDevice(i2c, address)
         self._i2c_read_delay = i2c_read_delay
+        self._combined = combined
+        self._begun = False
+
+    async def begin(self):
+        """Initialize the accessory without blocking the event loop."""
+        await asyncio.sleep(_I2C_INIT_DELAY)
+        # turn off encrypted data
+        await _run_blocking(self._write, _INIT1)
+        await asyncio.sleep(_I2C_INIT_DELAY)
+        await _run_blocking(self._write, _INIT2)
+        self._begun = True
+
+    def begin_sync(self):
+        """Initialize the accessory, blocking for about 200ms."""
+        time.sleep(_I2C_INIT_DELAY)
+        # turn off encrypted data
+        self._write(_INIT1)
         time.sleep(_I2C_INIT_DELAY)
-        with self.i2c_device as i2c_dev:
-            # turn off encrypted data
-            # http://wiibrew.org/wiki/Wiimote/Extension_Controllers
-            i2c_dev.write(b"\xF0\x55")
-            time.sleep(_I2C_INIT_DELAY)
-            i2c_dev.write(b"\xFB\x00")
+        self._write(_INIT2)
+        self._begun = True
 
     def _read_data(self):
-        return self._read_register(b"\x00")
+        return self._read_register(_REG0)
 
     def _read_register(self, address):
+        if not self._begun:
+            self.begin_sync()
+        if self._combined:
+            self._write_then_read(address)
+            return self.buffer
+        # the bus is released while waiting so other devices can use it
+        self._write(address)
+        time.sleep(self._i2c_read_delay)  # at least 200us
+        self._read_buffer()
+        return self.buffer
+
+    def _write(self, data):
+        with self.i2c_device as i2c:
+            i2c.write(data)
+
+    def _read_buffer(self):
         with self.i2c_device as i2c:
-            i2c.write(address)
-            time.sleep(self._i2c_read_delay)  # at least 200us
             i2c.readinto(self.buffer)
+
+    def _write_then_read(self, address):
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(address, self.buffer)
+
+
+class AsyncWiiChuckBase(WiiChuckBase):
+    """
+    Base Class for Nintendo Nunchuk Accessories whose data is read from
+    asyncio code. The delay between the I2C write and read is awaited, with
+    the bus released, instead of blocking the event loop.
+
+    Combine it with an accessory class and call `update` to take a sample;
+    the properties then decode the last sample without using the bus::
+
+        class AsyncNunchuk(AsyncWiiChuckBase, Nunchuk):
+            pass
+
+        nunchuk = AsyncNunchuk(i2c)
+        await nunchuk.update()
+        print(nunchuk.joystick)
+
+    :param i2c: The `busio.I2C` object to use.
+    :param address: The I2C address of the device. Default is 0x52.
+    :type address: int, optional
+    :param i2c_read_delay: The time in seconds to pause between the
+        I2C write and read. This needs to be at least 200us.
+    :type i2c_read_delay: float, optional
+    :param combined: Read with one combined (repeated start) transaction
+        instead, without the delay. Default is False.
+    :type combined: bool, optional
+    """
+
+    async def update(self):
+        """Read a new sample from the device, initializing it first if needed."""
+        if not self._begun:
+            await self.begin()
+        await self._async_read_register(_REG0)
+
+    async def _async_read_register(self, address):
+        if self._combined:
+            await _run_blocking(self._write_then_read, address)
+            return self.buffer
+        await _run_blocking(self._write, address)
+        await asyncio.sleep(self._i2c_read_delay)  # at least 200us
+        await _run_blocking(self._read_buffer)
+        return self.buffer
+
+    def _read_register(self, address):
+        # samples are only taken by update()
         return self.buffer
@@ -44,6 +44,10 @@ class Guitar(WiiChuckBase):
         conservative default of 2000us is used since some hosts may
         not be able to achieve such timing.
     :type i2c_read_delay: float, optional
+    :param combined: Read with one combined (repeated start) transaction
+        instead, without the delay, for hosts and accessories that
+        tolerate it. Default is False.
+    :type combined: bool, optional
     """
 
     _Values = namedtuple(
@@ -66,8 +70,10 @@ class Guitar(WiiChuckBase):
     )
     _Strum = namedtuple("Strum", ("up", "down"))
 
-    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002):
-        super().__init__(i2c, address=address, i2c_read_delay=i2c_read_delay)
+    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002, combined=False):
+        super().__init__(
+            i2c, address=address, i2c_read_delay=i2c_read_delay, combined=combined
+        )
 
     @property
     def values(self):
@@ -46,24 +46,31 @@ class Nunchuk(WiiChuckBase):
         conservative default of 2000us is used since some hosts may
         not be able to achieve such timing.
     :type i2c_read_delay: float, optional
+    :param combined: Read with one combined (repeated start) transaction
+        instead, without the delay, for hosts and accessories that
+        tolerate it. Default is False.
+    :type combined: bool, optional
     """
 
     _Values = namedtuple("Values", ("joystick", "buttons", "acceleration"))
     _Joystick = namedtuple("Joystick", ("x", "y"))
     _Buttons = namedtuple("Buttons", ("C", "Z"))
     _Acceleration = namedtuple("Acceleration", ("x", "y", "z"))
+    _Sample = namedtuple("Sample", ("jx", "jy", "ax", "ay", "az", "c", "z"))
 
-    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002):
-        super().__init__(i2c, address=address, i2c_read_delay=i2c_read_delay)
+    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002, combined=False):
+        super().__init__(
+            i2c, address=address, i2c_read_delay=i2c_read_delay, combined=combined
+        )
 
     @property
     def values(self):
         """The current state of all values."""
-        self._read_data()
+        sample = self._read_data()
         return self._Values(
-            self._joystick(do_read=False),
-            self._buttons(do_read=False),
-            self._acceleration(do_read=False),
+            self._Joystick(sample.jx, sample.jy),
+            self._Buttons(sample.c, sample.z),
+            self._Acceleration(sample.ax, sample.ay, sample.az),
         )
 
     @property
@@ -82,22 +89,39 @@ class Nunchuk(WiiChuckBase):
         return self._acceleration()
 
     def _joystick(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Joystick(self.buffer[0], self.buffer[1])  # x, y
+        sample = self._sample(do_read)
+        return self._Joystick(sample.jx, sample.jy)
 
     def _buttons(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Buttons(
-            not bool(self.buffer[5] & 0x02), not bool(self.buffer[5] & 0x01)  # C  # Z
-        )
+        sample = self._sample(do_read)
+        return self._Buttons(sample.c, sample.z)
 
     def _acceleration(self, do_read=True):
+        sample = self._sample(do_read)
+        return self._Acceleration(sample.ax, sample.ay, sample.az)
+
+    def _sample(self, do_read):
         if do_read:
-            self._read_data()
-        return self._Acceleration(
-            ((self.buffer[5] & 0xC0) >> 6) | (self.buffer[2] << 2),  # ax
-            ((self.buffer[5] & 0x30) >> 4) | (self.buffer[3] << 2),  # ay
-            ((self.buffer[5] & 0x0C) >> 2) | (self.buffer[4] << 2),  # az
+            return self._read_data()
+        return self._parse_buffer()
+
+    def _read_data(self):
+        """Overides the ``_read_data()`` function.
+
+        Returns the sample parsed into an immutable ``_Sample`` instead of the
+        buffer, which is overwritten by the next read.
+        """
+        super()._read_data()
+        return self._parse_buffer()
+
+    def _parse_buffer(self):
+        buffer = self.buffer
+        return self._Sample(
+            buffer[0],  # jx
+            buffer[1],  # jy
+            ((buffer[5] & 0xC0) >> 6) | (buffer[2] << 2),  # ax
+            ((buffer[5] & 0x30) >> 4) | (buffer[3] << 2),  # ay
+            ((buffer[5] & 0x0C) >> 2) | (buffer[4] << 2),  # az
+            not bool(buffer[5] & 0x02),  # C
+            not bool(buffer[5] & 0x01),  # Z
         )